@@ -4,14 +4,15 @@ import ccxt.pro as ccxt_pro
 import ccxt.async_support as ccxt_async
 import pprint
 import asyncio
+import heapq
 import traceback
 import numpy as np
 from collections import defaultdict
+from operator import itemgetter
 from pure_funcs import (
     multi_replace,
     floatify,
     ts_to_date_utc,
-    calc_hash,
     determine_pos_side_ccxt,
     symbol_to_coin,
     flatten,
@@ -25,24 +26,18 @@ assert_correct_ccxt_version(ccxt=ccxt_async)
 class BybitBot(Passivbot):
     def __init__(self, config: dict):
         super().__init__(config)
+        self.time_in_force = "postOnly" if config["live"]["time_in_force"] == "post_only" else "GTC"
 
     def create_ccxt_sessions(self):
-        self.ccp = getattr(ccxt_pro, self.exchange)(
-            {
-                "apiKey": self.user_info["key"],
-                "secret": self.user_info["secret"],
-                "password": self.user_info["passphrase"],
-                "headers": {"referer": self.broker_code} if self.broker_code else {},
-            }
-        )
-        self.cca = getattr(ccxt_async, self.exchange)(
-            {
-                "apiKey": self.user_info["key"],
-                "secret": self.user_info["secret"],
-                "password": self.user_info["passphrase"],
-                "headers": {"referer": self.broker_code} if self.broker_code else {},
-            }
-        )
+        # same credentials for both sessions; ccxt deep-copies config on init
+        session_config = {
+            "apiKey": self.user_info["key"],
+            "secret": self.user_info["secret"],
+            "password": self.user_info["passphrase"],
+            "headers": {"referer": self.broker_code} if self.broker_code else {},
+        }
+        self.ccp = getattr(ccxt_pro, self.exchange)(session_config)
+        self.cca = getattr(ccxt_async, self.exchange)(session_config)
 
     def set_market_specific_settings(self):
         super().set_market_specific_settings()
@@ -75,9 +70,9 @@ class BybitBot(Passivbot):
                 if self.stop_websocket:
                     break
                 res = await self.ccp.watch_orders()
-                for i in range(len(res)):
-                    res[i]["position_side"] = determine_pos_side_ccxt(res[i])
-                    res[i]["qty"] = res[i]["amount"]
+                for elm in res:
+                    elm["position_side"] = determine_pos_side_ccxt(elm)
+                    elm["qty"] = elm["amount"]
                 self.handle_order_update(res)
             except Exception as e:
                 print(f"exception watch_orders", e)
@@ -91,7 +86,7 @@ class BybitBot(Passivbot):
         try:
             fetched = await self.cca.fetch_open_orders(symbol=symbol, limit=limit)
             while True:
-                if all([elm["id"] in open_orders for elm in fetched]):
+                if all(elm["id"] in open_orders for elm in fetched):
                     break
                 next_page_cursor = None
                 for elm in fetched:
@@ -108,7 +103,7 @@ class BybitBot(Passivbot):
                 fetched = await self.cca.fetch_open_orders(
                     symbol=symbol, limit=limit, params={"cursor": next_page_cursor}
                 )
-            return sorted(open_orders.values(), key=lambda x: x["timestamp"])
+            return sorted(open_orders.values(), key=itemgetter("timestamp"))
         except Exception as e:
             logging.error(f"error fetching open orders {e}")
             print_async_exception(fetched)
@@ -135,7 +130,7 @@ class BybitBot(Passivbot):
             else:
                 balance = fetched_balance[self.quote]["total"]
             while True:
-                if all([elm["symbol"] + elm["side"] in positions for elm in fetched_positions]):
+                if all(elm["symbol"] + elm["side"] in positions for elm in fetched_positions):
                     break
                 next_page_cursor = None
                 for elm in fetched_positions:
@@ -145,7 +140,6 @@ class BybitBot(Passivbot):
                     positions[elm["symbol"] + elm["side"]] = elm
                     if "nextPageCursor" in elm["info"]:
                         next_page_cursor = elm["info"]["nextPageCursor"]
-                    positions[elm["symbol"] + elm["side"]] = elm
                 if len(fetched_positions) < limit:
                     break
                 if next_page_cursor is None:
@@ -154,7 +148,7 @@ class BybitBot(Passivbot):
                 fetched_positions = await self.cca.fetch_positions(
                     params={"cursor": next_page_cursor, "limit": limit}
                 )
-            return sorted(positions.values(), key=lambda x: x["timestamp"]), balance
+            return sorted(positions.values(), key=itemgetter("timestamp")), balance
         except Exception as e:
             logging.error(f"error fetching positions and balance {e}")
             print_async_exception(fetched_positions)
@@ -194,11 +188,12 @@ class BybitBot(Passivbot):
         start_time: int = None,
         end_time: int = None,
     ):
+        # each fetch_pnl result is already sorted by timestamp
         if start_time is None:
-            pnls = await self.fetch_pnl(start_time=start_time, end_time=end_time)
+            pages = [await self.fetch_pnl(start_time=start_time, end_time=end_time)]
         else:
             week = 1000 * 60 * 60 * 24 * 7
-            pnls = []
+            pages = []
             if end_time is None:
                 end_time = int(self.get_exchange_time() + 1000 * 60 * 60 * 24)
             # bybit has limit of 7 days per paginated fetch
@@ -209,12 +204,12 @@ class BybitBot(Passivbot):
                 ets = sts + week
                 sts = max(sts, start_time)
                 fetched = await self.fetch_pnl(start_time=sts, end_time=ets)
-                pnls.extend(fetched)
+                pages.append(fetched)
                 if sts <= start_time:
                     break
                 i += 1
                 logging.info(f"fetched pnls for more than a week {ts_to_date_utc(sts)}")
-        return sorted(pnls, key=lambda x: x["timestamp"])
+        return list(heapq.merge(*pages, key=itemgetter("timestamp")))
 
     async def fetch_pnl(
         self,
@@ -235,19 +230,13 @@ class BybitBot(Passivbot):
                 params["endTime"] = int(end_time)
             fetched = (await self.cca.private_get_v5_position_closed_pnl(params))["result"]
             while True:
-                fetched["list"] = sorted(
-                    floatify(fetched["list"]), key=lambda x: float(x["updatedTime"])
-                )
-                for i in range(len(fetched["list"])):
-                    fetched["list"][i]["timestamp"] = float(fetched["list"][i]["updatedTime"])
-                    fetched["list"][i]["symbol"] = self.get_symbol_id_inv(
-                        fetched["list"][i]["symbol"]
-                    )
-                    fetched["list"][i]["pnl"] = float(fetched["list"][i]["closedPnl"])
-                    fetched["list"][i]["side"] = fetched["list"][i]["side"].lower()
-                    fetched["list"][i]["position_side"] = (
-                        "long" if fetched["list"][i]["side"] == "sell" else "short"
-                    )
+                fetched["list"] = sorted(floatify(fetched["list"]), key=itemgetter("updatedTime"))
+                for elm in fetched["list"]:
+                    elm["timestamp"] = float(elm["updatedTime"])
+                    elm["symbol"] = self.get_symbol_id_inv(elm["symbol"])
+                    elm["pnl"] = float(elm["closedPnl"])
+                    elm["side"] = elm["side"].lower()
+                    elm["position_side"] = "long" if elm["side"] == "sell" else "short"
                 if fetched["list"] == []:
                     break
                 if (
@@ -271,7 +260,7 @@ class BybitBot(Passivbot):
                 )
                 params["cursor"] = fetched["nextPageCursor"]
                 fetched = (await self.cca.private_get_v5_position_closed_pnl(params))["result"]
-            return sorted(all_pnls, key=lambda x: x["updatedTime"])
+            return sorted(all_pnls, key=itemgetter("updatedTime"))
         except Exception as e:
             logging.error(f"error fetching pnls {e}")
             print_async_exception(fetched)
@@ -281,25 +270,24 @@ class BybitBot(Passivbot):
     async def fetch_fills(self, start_time, end_time, limit=None):
         if start_time is None:
             result = await self.cca.fetch_my_trades()
-            return sorted(result, key=lambda x: x["timestamp"])
+            return sorted(result, key=itemgetter("timestamp"))
         if end_time is None:
             end_time = int(self.get_exchange_time() + 1000 * 60 * 60 * 4)
-        all_fetched_fills = []
-        prev_hash = ""
+        all_fetched_fills = {}
         for _ in range(100):
             fills = await self.cca.fetch_my_trades(
                 limit=limit, params={"paginate": True, "endTime": int(end_time)}
             )
             if not fills:
                 break
-            fills.sort(key=lambda x: x["timestamp"])
-            all_fetched_fills += fills
+            fills.sort(key=itemgetter("timestamp"))
+            n_fills_before = len(all_fetched_fills)
+            all_fetched_fills.update((x["id"], x) for x in fills)
             if fills[0]["timestamp"] <= start_time:
                 break
-            new_hash = calc_hash([x["id"] for x in fills])
-            if new_hash == prev_hash:
+            if len(all_fetched_fills) == n_fills_before:
+                # page contained no new fills
                 break
-            prev_hash = new_hash
             logging.info(
                 f"fetched fills from {fills[0]['datetime']} to {fills[-1]['datetime']} n fills: {len(fills)}"
             )
@@ -307,7 +295,7 @@ class BybitBot(Passivbot):
             limit = 1000
         else:
             logging.error(f"more than 100 calls to ccxt fetch_my_trades")
-        return sorted(all_fetched_fills, key=lambda x: x["timestamp"])
+        return sorted(all_fetched_fills.values(), key=itemgetter("timestamp"))
 
     async def fetch_pnls(self, start_time=None, end_time=None, limit=None):
         # fetch fills first, then pnls (bybit has them in separate endpoints)
@@ -340,7 +328,7 @@ class BybitBot(Passivbot):
                 x["id"] = x["orderId"]
                 fillsd[x["orderId"]] = [x]
         joined = {x["info"]["execId"]: x for x in flatten(fillsd.values())}
-        return sorted(joined.values(), key=lambda x: x["timestamp"])
+        return sorted(joined.values(), key=itemgetter("timestamp"))
 
     def determine_pos_side(self, x):
         if x["side"] == "buy":
@@ -389,9 +377,7 @@ class BybitBot(Passivbot):
             price=order["price"],
             params={
                 "positionIdx": 1 if order["position_side"] == "long" else 2,
-                "timeInForce": (
-                    "postOnly" if self.config["live"]["time_in_force"] == "post_only" else "GTC"
-                ),
+                "timeInForce": self.time_in_force,
                 "orderLinkId": order["custom_id"],
             },
         )
@@ -472,4 +458,4 @@ class BybitBot(Passivbot):
                 break
             since = fetched[-1][0]
         all_fetched_d = {x[0]: x for x in all_fetched}
-        return sorted(all_fetched_d.values(), key=lambda x: x[0])
+        return sorted(all_fetched_d.values(), key=itemgetter(0))
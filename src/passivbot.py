@@ -194,13 +194,13 @@ class Passivbot:
                 self.ineligible_symbols[symbol] = "wrong quote"
             elif not self.symbol_is_eligible(symbol):
                 self.ineligible_symbols[symbol] = f"not eligible on {self.exchange}"
-            elif not self.symbol_is_eligible(symbol):
-                self.ineligible_symbols[symbol] = f"not eligible on {self.exchange}"
             else:
                 self.eligible_symbols.add(symbol)
         if verbose:
-            for line in set(self.ineligible_symbols.values()):
-                syms_ = [s for s in self.ineligible_symbols if self.ineligible_symbols[s] == line]
+            ineligible_by_reason = defaultdict(list)
+            for symbol, reason in self.ineligible_symbols.items():
+                ineligible_by_reason[reason].append(symbol)
+            for line, syms_ in ineligible_by_reason.items():
                 if len(syms_) > 12:
                     logging.info(f"{line}: {len(syms_)} symbols")
                 elif len(syms_) > 0:
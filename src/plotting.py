@@ -1,8 +1,13 @@
+import io
 import json
 import re
 import os
+import math
+import multiprocessing
 
+import matplotlib
 import matplotlib.pyplot as plt
+from matplotlib.figure import Figure
 import pandas as pd
 import numpy as np
 import time
@@ -13,40 +18,47 @@ from procedures import dump_live_config, make_get_filepath
 from pure_funcs import denumpyize, ts_to_date
 import passivbot_rust as pbr
 
+try:
+    import orjson
+except:
+    print("orjson not found, trying without...")
+    orjson = None
+
+ANSI_ESCAPE_RE = re.compile(r"\x1b\[[0-9;]*m")
+# below this many chunk plots (~0.2s each), rendering in-process beats spawning pool workers,
+# which each re-import plotting, ccxt and numba
+MIN_CHUNKS_FOR_POOL = 16
+
 
 def make_table(result_):
     result = result_.copy()
-    if "result" not in result:
-        result["result"] = result
+    r = result["result"] if "result" in result else result
     table = PrettyTable(["Metric", "Value"])
     table.align["Metric"] = "l"
     table.align["Value"] = "l"
     table.title = "Summary"
 
-    table.add_row(["Exchange", result["exchange"] if "exchange" in result else "unknown"])
-    table.add_row(["Market type", result["market_type"] if "market_type" in result else "unknown"])
-    table.add_row(["Symbol", result["symbol"] if "symbol" in result else "unknown"])
-    table.add_row(
-        ["Passivbot mode", result["passivbot_mode"] if "passivbot_mode" in result else "unknown"]
-    )
-    table.add_row(
+    rows = [
+        ["Exchange", result["exchange"] if "exchange" in result else "unknown"],
+        ["Market type", result["market_type"] if "market_type" in result else "unknown"],
+        ["Symbol", result["symbol"] if "symbol" in result else "unknown"],
+        ["Passivbot mode", result["passivbot_mode"] if "passivbot_mode" in result else "unknown"],
         [
             "ADG n subdivisions",
             result["adg_n_subdivisions"] if "adg_n_subdivisions" in result else "unknown",
-        ]
-    )
-    table.add_row(["No. days", pbr.round_dynamic(result["result"]["n_days"], 2)])
-    table.add_row(["Starting balance", pbr.round_dynamic(result["result"]["starting_balance"], 6)])
+        ],
+        ["No. days", pbr.round_dynamic(r["n_days"], 2)],
+        ["Starting balance", pbr.round_dynamic(r["starting_balance"], 6)],
+    ]
     for side in ["long", "short"]:
         if side not in result:
             result[side] = {"enabled": result[f"do_{side}"]}
         if result[side]["enabled"]:
-            table.add_row([" ", " "])
-            table.add_row([side.capitalize(), True])
+            rows.append([" ", " "])
+            rows.append([side.capitalize(), True])
             profit_color = (
                 Fore.RED
-                if f"final_balance_{side}" in result["result"]
-                and result["result"][f"final_balance_{side}"] < result["result"]["starting_balance"]
+                if f"final_balance_{side}" in r and r[f"final_balance_{side}"] < r["starting_balance"]
                 else Fore.RESET
             )
             for title, key, precision, mul, suffix in [
@@ -98,16 +110,16 @@ def make_table(result_):
                 ("Equity/balance ratio std", f"equity_balance_ratio_std_{side}", 4, 1, ""),
                 ("Ratio of time spent at max exposure", f"time_at_max_exposure_{side}", 4, 1, ""),
             ]:
-                if key in result["result"]:
-                    val = pbr.round_dynamic(result["result"][key] * mul, precision)
-                    table.add_row(
+                if key in r:
+                    val = pbr.round_dynamic(r[key] * mul, precision)
+                    rows.append(
                         [
                             title,
                             f"{profit_color}{val}{suffix}{Fore.RESET}",
                         ]
                     )
                 elif title == "#newline":
-                    table.add_row([" ", " "])
+                    rows.append([" ", " "])
             for title, key in [
                 ("No. fills", f"n_fills_{side}"),
                 ("No. entries", f"n_entries_{side}"),
@@ -118,23 +130,23 @@ def make_table(result_):
                 ("No. unstuck/EMA closes", f"n_unstuck_closes_{side}"),
                 ("No. normal closes", f"n_normal_closes_{side}"),
             ]:
-                if key in result["result"]:
-                    table.add_row([title, result["result"][key]])
+                if key in r:
+                    rows.append([title, r[key]])
             for title, key, precision in [
                 ("Average n fills per day", f"avg_fills_per_day_{side}", 3),
                 ("Mean hours stuck", f"hrs_stuck_avg_{side}", 6),
                 ("Max hours stuck", f"hrs_stuck_max_{side}", 6),
             ]:
-                if key in result["result"]:
-                    table.add_row([title, pbr.round_dynamic(result["result"][key], precision)])
+                if key in r:
+                    rows.append([title, pbr.round_dynamic(r[key], precision)])
 
-            if f"pnl_sum_{side}" in result["result"]:
-                profit_color = Fore.RED if result["result"][f"pnl_sum_{side}"] < 0 else Fore.RESET
+            if f"pnl_sum_{side}" in r:
+                profit_color = Fore.RED if r[f"pnl_sum_{side}"] < 0 else Fore.RESET
 
-                table.add_row(
+                rows.append(
                     [
                         "PNL sum",
-                        f"{profit_color}{pbr.round_dynamic(result['result'][f'pnl_sum_{side}'], 4)}{Fore.RESET}",
+                        f"{profit_color}{pbr.round_dynamic(r[f'pnl_sum_{side}'], 4)}{Fore.RESET}",
                     ]
                 )
             for title, key, precision in [
@@ -145,11 +157,88 @@ def make_table(result_):
                 ("Volume quote", f"volume_quote_{side}", 6),
                 ("Biggest pos size", f"biggest_psize_{side}", 3),
             ]:
-                if key in result["result"]:
-                    table.add_row([title, pbr.round_dynamic(result["result"][key], precision)])
+                if key in r:
+                    rows.append([title, pbr.round_dynamic(r[key], precision)])
+    table.add_rows(rows)
     return table
 
 
+def calc_lttb_indices(ys: np.ndarray, n_out: int) -> np.ndarray:
+    # Largest-Triangle-Three-Buckets downsampling, assuming evenly spaced x
+    # returns sorted indices of the points to keep, always including first and last
+    n = len(ys)
+    if n <= n_out or n_out < 3:
+        return np.arange(n)
+    # n_out - 2 middle buckets over points 1..n-2, sized like np.array_split
+    n_buckets = n_out - 2
+    sizes = np.full(n_buckets, (n - 2) // n_buckets, dtype=np.int64)
+    sizes[: (n - 2) % n_buckets] += 1
+    edges = np.concatenate([[1], 1 + np.cumsum(sizes), [n]])
+    kept = np.empty(n_out, dtype=np.int64)
+    kept[0], kept[-1] = 0, n - 1
+    a = 0
+    for i in range(n_buckets):
+        lo, hi = edges[i], edges[i + 1]
+        next_x = (edges[i + 1] + edges[i + 2] - 1) / 2
+        next_y = ys[edges[i + 1] : edges[i + 2]].mean()
+        xs = np.arange(lo, hi)
+        areas = np.abs((a - next_x) * (ys[lo:hi] - ys[a]) - (a - xs) * (next_y - ys[a]))
+        a = lo + int(np.argmax(areas))
+        kept[i + 1] = a
+    return kept
+
+
+def downsample_for_plot(df: pd.DataFrame, columns: [str], n_out: int = 4000) -> pd.DataFrame:
+    # keep the union of each column's LTTB points so line shapes survive downsampling
+    if len(df) <= n_out:
+        return df
+    idxs = np.unique(
+        np.concatenate([calc_lttb_indices(df[c].to_numpy(dtype=float), n_out) for c in columns])
+    )
+    return df.iloc[idxs]
+
+
+def metrics_are_finite(metrics: dict) -> bool:
+    # nan/inf in a backtest result come from the computed metrics; config values are finite
+    for v in metrics.values():
+        if isinstance(v, (float, np.floating)):
+            if not math.isfinite(v):
+                return False
+        elif isinstance(v, np.ndarray) and v.dtype.kind == "f":
+            if not np.isfinite(v).all():
+                return False
+    return True
+
+
+def dump_result_json(result: dict, filepath: str):
+    # orjson handles numpy types natively, skipping the denumpyize pass,
+    # but writes nan/inf as null; stdlib json keeps them as NaN/Infinity floats
+    if orjson is not None and metrics_are_finite(result.get("result", result)):
+        try:
+            dumped = orjson.dumps(
+                result,
+                option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS,
+            )
+            with open(filepath, "wb") as f:
+                f.write(dumped)
+            return
+        except TypeError as e:
+            print("orjson unable to serialize result, falling back to json", e)
+    # same 2-space indent as the orjson path
+    json.dump(denumpyize(result), open(filepath, "w"), indent=2)
+
+
+def save_figure(fig, filepath: str, **kwargs):
+    # render in memory, then write in one go and rename into place,
+    # so a png on disk is never half-written
+    buf = io.BytesIO()
+    fig.savefig(buf, format="png", **kwargs)
+    tmp_filepath = filepath + ".tmp"
+    with open(tmp_filepath, "wb") as f:
+        f.write(buf.getbuffer())
+    os.replace(tmp_filepath, filepath)
+
+
 def dump_plots(
     result: dict,
     longs: pd.DataFrame,
@@ -159,6 +248,12 @@ def dump_plots(
     n_parts: int = None,
     disable_plotting: bool = False,
 ):
+    """
+    Write the backtest summary, csvs, result.json and plots to result["plots_dirpath"].
+    With MIN_CHUNKS_FOR_POOL or more per-chunk fill plots, those are rendered by a spawn-based
+    multiprocessing pool, so scripts calling this must guard their entry point with
+    if __name__ == "__main__"; otherwise starting the workers raises a RuntimeError.
+    """
     init(autoreset=True)
     plt.rcParams["figure.figsize"] = [29, 18]
     try:
@@ -178,35 +273,51 @@ def dump_plots(
     table = make_table(result)
 
     dump_live_config(result, result["plots_dirpath"] + "live_config.json")
-    json.dump(denumpyize(result), open(result["plots_dirpath"] + "result.json", "w"), indent=4)
+    dump_result_json(result, result["plots_dirpath"] + "result.json")
 
     print("writing backtest_result.txt...\n")
     with open(f"{result['plots_dirpath']}backtest_result.txt", "w") as f:
         output = table.get_string(border=True, padding_width=1)
         print(output)
-        f.write(re.sub("\033\\[([0-9]+)(;[0-9]+)*m", "", output))
+        f.write(ANSI_ESCAPE_RE.sub("", output))
 
     if disable_plotting:
         return
-    n_parts = (
-        n_parts
-        if n_parts is not None
-        else min(12, max(3, int(pbr.round_up(result["n_days"] / 14, 1.0))))
-    )
+    n_parts = n_parts if n_parts is not None else min(12, max(3, math.ceil(result["n_days"] / 14)))
+    # index klines and fills by timestamp once, not in every plot_fills call
+    if df.index.name != "timestamp":
+        df = df.set_index("timestamp")
+    # chunk plots of both sides, rendered together once the summary plots are written
+    chunks = []
+    # one figure for all summary plots; axes are cleared between plots
+    fig, ax = plt.subplots()
     for side, fdf in [("long", longs), ("short", shorts)]:
         if result[side]["enabled"]:
-            plt.clf()
-            fig = plot_fills(df, fdf, plot_whole_df=True, title=f"Overview Fills {side.capitalize()}")
-            if not fig:
+            if fdf.index.name != "timestamp":
+                fdf = fdf.set_index("timestamp")
+            masks = calc_fill_type_masks(fdf)
+            overview = plot_fills(
+                df,
+                fdf,
+                plot_whole_df=True,
+                title=f"Overview Fills {side.capitalize()}",
+                masks=masks,
+                ax=ax,
+            )
+            if overview is None:
                 continue
-            fig.savefig(f"{result['plots_dirpath']}whole_backtest_{side}.png")
+            save_figure(fig, f"{result['plots_dirpath']}whole_backtest_{side}.png")
             print(f"\nplotting balance and equity {side} {result['plots_dirpath']}...")
-            plt.clf()
-            sdf[f"balance_{side}"].plot()
-            sdf[f"equity_{side}"].plot(
-                title=f"Balance and equity {side.capitalize()}", xlabel="Time", ylabel="Balance"
+            ax.cla()
+            sdfd = downsample_for_plot(sdf, [f"balance_{side}", f"equity_{side}"])
+            sdfd[f"balance_{side}"].plot(ax=ax)
+            sdfd[f"equity_{side}"].plot(
+                ax=ax,
+                title=f"Balance and equity {side.capitalize()}",
+                xlabel="Time",
+                ylabel="Balance",
             )
-            plt.savefig(f"{result['plots_dirpath']}balance_and_equity_sampled_{side}.png")
+            save_figure(fig, f"{result['plots_dirpath']}balance_and_equity_sampled_{side}.png")
 
             if result["passivbot_mode"] == "clock":
                 spans = sorted(
@@ -240,19 +351,27 @@ def dump_plots(
                             index=df.index,
                         )
                     )
+            # each chunk carries only the slice of df it plots
+            edges = np.linspace(0, len(fdf), n_parts + 1).astype(int)
             for z in range(n_parts):
                 start_ = z / n_parts
                 end_ = (z + 1) / n_parts
                 print(f"{side} {z} of {n_parts} {start_ * 100:.2f}% to {end_ * 100:.2f}%")
-                fig = plot_fills(
-                    df,
-                    fdf.iloc[int(len(fdf) * start_) : int(len(fdf) * end_)],
-                    title=f"Fills {side} {z+1} of {n_parts}",
+                slice_ = slice(edges[z], edges[z + 1])
+                fdfc = fdf.iloc[slice_]
+                if fdfc.empty:
+                    print(f"no {side} fills {z + 1} of {n_parts}...")
+                    continue
+                dfc = df.loc[fdfc.index[0] : fdfc.index[-1]]
+                chunks.append(
+                    (
+                        dfc,
+                        fdfc,
+                        masks.iloc[slice_],
+                        f"Fills {side} {z+1} of {n_parts}",
+                        f"{result['plots_dirpath']}backtest_{side}{z + 1}of{n_parts}.png",
+                    )
                 )
-                if fig is not None:
-                    fig.savefig(f"{result['plots_dirpath']}backtest_{side}{z + 1}of{n_parts}.png")
-                else:
-                    print(f"no {side} fills...")
             if result["passivbot_mode"] == "clock":
                 if "ema_band_lower" in df.columns:
                     df = df.drop(["ema_band_lower"], axis=1)
@@ -260,73 +379,125 @@ def dump_plots(
                     df = df.drop(["ema_band_upper"], axis=1)
 
     print("plotting wallet exposures...")
-    plt.clf()
+    ax.cla()
     sdf.wallet_exposure_short = sdf.wallet_exposure_short.abs() * -1
-    sdf[["wallet_exposure_long", "wallet_exposure_short"]].plot(
+    we_columns = ["wallet_exposure_long", "wallet_exposure_short"]
+    downsample_for_plot(sdf, we_columns)[we_columns].plot(
+        ax=ax,
         title="Wallet exposures: +long, -short",
         xlabel="Time",
         ylabel="Wallet Exposure",
     )
-    plt.savefig(f"{result['plots_dirpath']}wallet_exposures_plot.png")
+    save_figure(fig, f"{result['plots_dirpath']}wallet_exposures_plot.png")
+    plt.close(fig)
 
+    n_processes = min(len(chunks), os.cpu_count() or 1)
+    if len(chunks) < MIN_CHUNKS_FOR_POOL or n_processes < 2:
+        for chunk in chunks:
+            plot_fills_to_file(*chunk)
+    else:
+        # spawn rather than fork so workers never inherit the parent's (possibly interactive)
+        # pyplot state
+        with multiprocessing.get_context("spawn").Pool(
+            processes=n_processes,
+            initializer=init_plot_worker,
+            initargs=(plt.rcParams["figure.figsize"],),
+        ) as pool:
+            pool.starmap(plot_fills_to_file, chunks)
+
+
+def init_plot_worker(figsize):
+    # pool workers only write png files; they draw on plain Figures and never use pyplot
+    matplotlib.use("Agg")
+    matplotlib.rcParams["figure.figsize"] = figsize
+
+
+def plot_fills_to_file(df, fdf, masks, title, filepath):
+    # module level so multiprocessing.Pool can pickle it; safe to call in the parent too
+    # chunk plots are previews; let matplotlib drop sub-pixel line vertices
+    with matplotlib.rc_context({"path.simplify": True, "path.simplify_threshold": 1.0}):
+        fig = plot_fills(df, fdf, title=title, masks=masks, ax=Figure().subplots())
+        save_figure(fig, filepath, dpi=80)
+
+
+def calc_fill_type_masks(fdf: pd.DataFrame) -> pd.DataFrame:
+    # match against the few distinct fill types, then broadcast to rows via the int category codes
+    types = fdf.type.astype("category")
+    codes = types.cat.codes.to_numpy()
+    categories = list(types.cat.categories)
+
+    def lookup(hits):
+        # trailing False so missing types (code -1) never match
+        return np.array(hits + [False])[codes]
+
+    substrings = ["long", "short", "ientry", "rentry", "secondary", "unstuck_entry", "unstuck_close"]
+    masks = {key: lookup([key in c for c in categories]) for key in substrings}
+    for pside in ["long", "short"]:
+        for key in [f"{pside}_nclose", f"clock_entry_{pside}", f"clock_close_{pside}"]:
+            masks[key] = lookup([c == key for c in categories])
+    return pd.DataFrame(masks, index=fdf.index)
+
+
+def plot_pprice_steps(ax, fills: pd.DataFrame, color: str):
+    # dashed segment from each nonzero pprice change to the next, drawn in one call
+    pprice = fills.pprice.to_numpy()
+    if not pprice.any():
+        # no open position anywhere in this window
+        return
+    changed = np.ones(len(pprice), dtype=bool)
+    changed[1:] = pprice[1:] != pprice[:-1]
+    changed &= pprice != 0.0
+    timestamps, pprice = fills.index.to_numpy()[changed], pprice[changed]
+    if len(pprice) > 1:
+        ax.hlines(pprice[:-1], timestamps[:-1], timestamps[1:], colors=color, linestyles="--")
 
-def plot_fills(df, fdf_, side: int = 0, plot_whole_df: bool = False, title=""):
+
+def plot_fills(df, fdf_, side: int = 0, plot_whole_df: bool = False, title="", masks=None, ax=None):
+    # masks: output of calc_fill_type_masks(fdf_), computed here if not given
+    # ax: axes to draw on (cleared first); defaults to the cleared current pyplot figure
     if fdf_.empty:
         return
-    plt.clf()
+    if masks is None:
+        masks = calc_fill_type_masks(fdf_)
+    m = {key: masks[key].to_numpy(dtype=bool) for key in masks.columns}
+    if ax is None:
+        plt.clf()
+        ax = plt.gca()
+    else:
+        ax.cla()
     fdf = fdf_.set_index("timestamp") if fdf_.index.name != "timestamp" else fdf_
     dfc = df  # .iloc[::max(1, int(len(df) * 0.00001))]
     if dfc.index.name != "timestamp":
         dfc = dfc.set_index("timestamp")
     if not plot_whole_df:
-        dfc = dfc[(dfc.index > fdf.index[0]) & (dfc.index < fdf.index[-1])]
-        dfc = dfc.loc[fdf.index[0] : fdf.index[-1]]
-    dfc.price.plot(style="y-", title=title, xlabel="Time", ylabel="Price + Fills")
+        # klines strictly between first and last fill; index is sorted, so bisect instead of masking
+        start = dfc.index.searchsorted(fdf.index[0], side="right")
+        end = dfc.index.searchsorted(fdf.index[-1], side="left")
+        dfc = dfc.iloc[start:end]
+    dfc.price.plot(ax=ax, style="y-", title=title, xlabel="Time", ylabel="Price + Fills")
     if "ema_band_lower" in dfc.columns and "ema_band_upper" in dfc.columns:
-        dfc.ema_band_lower.plot(style="b--")
-        dfc.ema_band_upper.plot(style="r--")
+        dfc.ema_band_lower.plot(ax=ax, style="b--")
+        dfc.ema_band_upper.plot(ax=ax, style="r--")
     if side >= 0:
-        longs = fdf[fdf.type.str.contains("long")]
-
-        longs[longs.type.str.contains("rentry") | longs.type.str.contains("ientry")].price.plot(
-            style="bo"
-        )
-        longs[longs.type.str.contains("secondary")].price.plot(style="go")
-        longs[longs.type == "long_nclose"].price.plot(style="ro")
-        longs[
-            (longs.type.str.contains("unstuck_entry")) | (longs.type == "clock_entry_long")
-        ].price.plot(style="bx")
-        longs[
-            (longs.type.str.contains("unstuck_close")) | (longs.type == "clock_close_long")
-        ].price.plot(style="rx")
-
-        lppu = longs[(longs.pprice != longs.pprice.shift(1)) & (longs.pprice != 0.0)]
-        for i in range(len(lppu) - 1):
-            plt.plot(
-                [lppu.index[i], lppu.index[i + 1]], [lppu.pprice.iloc[i], lppu.pprice.iloc[i]], "b--"
-            )
+        is_long = m["long"]
+        fdf[is_long & (m["rentry"] | m["ientry"])].price.plot(ax=ax, style="bo")
+        fdf[is_long & m["secondary"]].price.plot(ax=ax, style="go")
+        fdf[m["long_nclose"]].price.plot(ax=ax, style="ro")
+        fdf[is_long & (m["unstuck_entry"] | m["clock_entry_long"])].price.plot(ax=ax, style="bx")
+        fdf[is_long & (m["unstuck_close"] | m["clock_close_long"])].price.plot(ax=ax, style="rx")
+
+        plot_pprice_steps(ax, fdf[is_long], "b")
     if side <= 0:
-        shorts = fdf[fdf.type.str.contains("short")]
+        is_short = m["short"]
+        fdf[is_short & (m["rentry"] | m["ientry"])].price.plot(ax=ax, style="ro")
+        fdf[is_short & m["secondary"]].price.plot(ax=ax, style="go")
+        fdf[m["short_nclose"]].price.plot(ax=ax, style="bo")
+        fdf[is_short & (m["unstuck_entry"] | m["clock_entry_short"])].price.plot(ax=ax, style="rx")
+        fdf[is_short & (m["unstuck_close"] | m["clock_close_short"])].price.plot(ax=ax, style="bx")
 
-        shorts[shorts.type.str.contains("rentry") | shorts.type.str.contains("ientry")].price.plot(
-            style="ro"
-        )
-        shorts[shorts.type.str.contains("secondary")].price.plot(style="go")
-        shorts[shorts.type == "short_nclose"].price.plot(style="bo")
-        shorts[
-            (shorts.type.str.contains("unstuck_entry")) | (shorts.type == "clock_entry_short")
-        ].price.plot(style="rx")
-        shorts[
-            (shorts.type.str.contains("unstuck_close")) | (shorts.type == "clock_close_short")
-        ].price.plot(style="bx")
-
-        sppu = shorts[(shorts.pprice != shorts.pprice.shift(1)) & (shorts.pprice != 0.0)]
-        for i in range(len(sppu) - 1):
-            plt.plot(
-                [sppu.index[i], sppu.index[i + 1]], [sppu.pprice.iloc[i], sppu.pprice.iloc[i]], "r--"
-            )
+        plot_pprice_steps(ax, fdf[is_short], "r")
 
-    return plt
+    return ax.figure
 
 
 def scale_array(xs, bottom, top):
@@ -385,9 +556,9 @@ def plot_pnls_long_short(sdf, fdf, start_pct=0.0, end_pct=1.0, symbol=None):
         fdfc = fdfc[fdfc.symbol == symbol]
     longs = fdfc[fdfc.type.str.contains("long")]
     shorts = fdfc[fdfc.type.str.contains("short")]
-    ax = fdfc.pnl.cumsum().plot()
-    longs.pnl.cumsum().plot()
-    shorts.pnl.cumsum().plot()
+    ax = plt.gca()
+    for fills in [fdfc, longs, shorts]:
+        ax.plot(fills.index.to_numpy(), np.cumsum(fills.pnl.to_numpy()))
     ax.legend(["pnl_sum", "pnl_long", "pnl_short"])
     return plt
 
@@ -402,8 +573,10 @@ def plot_pnls_separate(sdf, fdf, start_pct=0.0, end_pct=1.0, symbols=None):
     start_minute = int(sdf.index[-1] * start_pct)
     end_minute = int(sdf.index[-1] * end_pct)
     fdfc = fdf.loc[start_minute:end_minute]
+    ax = plt.gca()
     for symbol in symbols:
-        ax = fdfc[fdfc.symbol == symbol].pnl.cumsum().plot()
+        fills = fdfc[fdfc.symbol == symbol]
+        ax.plot(fills.index.to_numpy(), np.cumsum(fills.pnl.to_numpy()))
     ax.legend(symbols)
     return plt
 
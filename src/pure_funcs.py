@@ -2028,9 +2028,10 @@ def determine_pos_side_ccxt(open_order: dict) -> str:
     else:
         oo = open_order
     if "positionIdx" in oo:  # bybit position
-        if float(oo["positionIdx"]) == 1.0:
+        position_idx = float(oo["positionIdx"])
+        if position_idx == 1.0:
             return "long"
-        if float(oo["positionIdx"]) == 2.0:
+        if position_idx == 2.0:
             return "short"
     keys_map = {key.lower().replace("_", ""): key for key in oo}
     for poskey in ["posside", "positionside"]: